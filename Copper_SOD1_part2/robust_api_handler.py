@@ -13,6 +13,13 @@ import os
 from datetime import datetime
 import random
 
+# orjson parses response bytes directly and is several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class RobustBVBRCHandler:
     """Robust BV-BRC API handler with comprehensive timeout and retry management"""
     
@@ -96,7 +103,7 @@ class RobustBVBRCHandler:
                 response = self.session.get(full_url, timeout=timeout)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     self.stats['successful_calls'] += 1
                     return True, data
                     
@@ -7,12 +7,73 @@ Common functions used across Track 1 (Amyloids), Track 2 (Copper), and Track 3 (
 import time
 import json
 import csv
-from typing import Dict, List, Optional
-from robust_api_handler import RobustBVBRCHandler
+import gzip
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from tqdm import tqdm
 
-# Initialize global API handler
-api_handler = RobustBVBRCHandler()
+# orjson is several times faster than stdlib json for the feature-heavy result records
+try:
+    import orjson
+    
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, default=str) + '\n').encode('utf-8')
+    
+    _loads = json.loads
+
+# Share the handler module's global instance so every track reuses one pooled session
+from robust_api_handler import api_handler
+
+@dataclass(slots=True)
+class Feature:
+    """Lightweight record for one BV-BRC genome feature
+    
+    Features are created in very large numbers across tracks; slots keep each
+    record far smaller than the equivalent dict and make field access faster.
+    Missing gene/product values are normalized to '' so they can be lowercased.
+    """
+    genome_id: str
+    gene: str
+    product: str
+    genome_name: str = ''
+    patric_id: str = ''
+    refseq_locus_tag: str = ''
+    accession: str = ''
+    feature_type: str = ''
+    start: Optional[int] = None
+    end: Optional[int] = None
+    strand: str = ''
+    na_length: Optional[int] = None
+    organism_name: str = ''
+    taxon_id: Optional[int] = None
+    search_term: str = ''
+    metal_cofactor: Optional[str] = None
+    
+    @classmethod
+    def from_record(cls, record: Dict, search_term: str = '') -> 'Feature':
+        """Build a Feature from a raw BV-BRC genome_feature record"""
+        return cls(
+            genome_id=str(record.get('genome_id') or ''),
+            gene=record.get('gene') or '',
+            product=record.get('product') or '',
+            genome_name=record.get('genome_name') or '',
+            patric_id=record.get('patric_id') or '',
+            refseq_locus_tag=record.get('refseq_locus_tag') or '',
+            accession=record.get('accession') or '',
+            feature_type=record.get('feature_type') or '',
+            start=record.get('start'),
+            end=record.get('end'),
+            strand=record.get('strand') or '',
+            na_length=record.get('na_length'),
+            organism_name=record.get('organism_name') or '',
+            taxon_id=record.get('taxon_id'),
+            search_term=search_term
+        )
 
 class BVBRCUtils:
     """Utility functions for BV-BRC API interactions across all tracks"""
@@ -67,73 +128,142 @@ class BVBRCUtils:
         Returns:
             List of consolidated search results
         """
+        return list(BVBRCUtils.iter_search_across_genomes(search_terms, genome_ids, search_type, track_name))
+    
+    @staticmethod
+    def iter_search_across_genomes(search_terms: List[str], genome_ids: List[str],
+                                   search_type: str = 'gene', track_name: str = "Unknown") -> Iterator[Dict]:
+        """Execute batch searches, yielding each term's consolidated result as soon as it completes
+        
+        Args:
+            search_terms: List of terms to search for
+            genome_ids: List of genome IDs to search in  
+            search_type: 'gene', 'product', or 'keyword'
+            track_name: Name of track for logging
+            
+        Yields:
+            Consolidated search result for one term
+        """
         print(f"🔍 {track_name}: Searching {len(search_terms)} terms across {len(genome_ids)} genomes...")
         
-        all_results = []
         successful_terms = 0
         total_features = 0
         
-        for search_term in tqdm(search_terms, desc=f"{track_name} Progress"):
-            print(f"   Searching: {search_term}")
+        # Per-query progress across all terms x genomes; redraws are throttled to 0.5s.
+        # The context manager closes the bar even if the consumer stops early or a search raises.
+        with tqdm(total=len(search_terms) * len(genome_ids), desc=f"{track_name} Progress",
+                  unit='query', mininterval=0.5) as progress:
+            for search_term in search_terms:
+                print(f"   Searching: {search_term}")
             
-            # Search this term across all genomes
-            term_results = []
-            term_features = 0
-            genome_coverage = {}  # Track per-genome feature counts for matrix creation
+                # Search this term across all genomes
+                term_results = []
+                term_features = 0
+                genome_coverage = {}  # Track per-genome feature counts for matrix creation
             
-            # Process genomes in smaller batches to avoid overwhelming API
-            batch_size = 20
-            for j in range(0, len(genome_ids), batch_size):
-                batch_genome_ids = genome_ids[j:j+batch_size]
+                # Process genomes in smaller batches to avoid overwhelming API
+                batch_size = 20
+                for j in range(0, len(genome_ids), batch_size):
+                    batch_genome_ids = genome_ids[j:j+batch_size]
                 
-                batch_results = BVBRCUtils.search_gene_in_genome_batch(
-                    search_term, batch_genome_ids, search_type
-                )
+                    batch_results = BVBRCUtils.search_gene_in_genome_batch(
+                        search_term, batch_genome_ids, search_type
+                    )
+                    progress.update(len(batch_genome_ids))
                 
-                for result in batch_results:
-                    genome_id = result.get('genome_id')
-                    feature_count = result.get('count', 0)
+                    for result in batch_results:
+                        genome_id = result.get('genome_id')
+                        feature_count = result.get('count', 0)
                     
-                    # Track per-genome coverage for matrix creation
-                    genome_coverage[genome_id] = feature_count
+                        # Track per-genome coverage for matrix creation
+                        genome_coverage[genome_id] = feature_count
                     
-                    if result['success'] and feature_count > 0:
-                        term_features += feature_count
-                        # Add the detailed features to term_results (correct key is 'results')
-                        if 'results' in result and result['results']:
-                            term_results.extend(result['results'])
+                        if result['success'] and feature_count > 0:
+                            term_features += feature_count
+                            # Add the detailed features to term_results (correct key is 'results')
+                            if 'results' in result and result['results']:
+                                term_results.extend(result['results'])
                 
-                # Delay between batches
-                time.sleep(0.5)
+                    # Delay between batches
+                    time.sleep(0.5)
+            
+                # Consolidate results for this term
+                term_summary = {
+                    'search_term': search_term,
+                    'search_type': search_type,
+                    'track_name': track_name,
+                    'genomes_searched': len(genome_ids),
+                    'features_found': term_features,
+                    'success': term_features > 0,
+                    'features': term_results,  # Now contains detailed feature data
+                    'genome_coverage': genome_coverage  # Per-genome feature counts for matrix
+                }
             
-            # Consolidate results for this term
-            term_summary = {
-                'search_term': search_term,
-                'search_type': search_type,
-                'track_name': track_name,
-                'genomes_searched': len(genome_ids),
-                'features_found': term_features,
-                'success': term_features > 0,
-                'features': term_results,  # Now contains detailed feature data
-                'genome_coverage': genome_coverage  # Per-genome feature counts for matrix
-            }
+                yield term_summary
             
-            all_results.append(term_summary)
+                if term_features > 0:
+                    successful_terms += 1
+                    total_features += term_features
+                    print(f"      ✅ Found {term_features} features")
+                else:
+                    print(f"      ❌ No features found")
             
-            if term_features > 0:
-                successful_terms += 1
-                total_features += term_features
-                print(f"      ✅ Found {term_features} features")
-            else:
-                print(f"      ❌ No features found")
+                progress.set_postfix(features=total_features, retries=api_handler.stats['retry_attempts'])
         
         print(f"🎯 {track_name} Batch Summary:")
         print(f"   Terms searched: {len(search_terms)}")
         print(f"   Successful terms: {successful_terms} ({(successful_terms/len(search_terms)*100):.1f}%)")
         print(f"   Total features: {total_features}")
         print(f"   Genomes searched: {len(genome_ids)}")
+    
+    @staticmethod
+    def write_results_jsonl(results: Iterable[Dict], name: str, output_dir: str = ".") -> str:
+        """Stream search results to a gzipped JSON Lines file, one result per line
+        
+        Args:
+            results: Iterable of search results (e.g. from iter_search_across_genomes)
+            name: File name prefix, typically the track name
+            output_dir: Directory to save the file in
+            
+        Returns:
+            Path of the written file
+        """
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        results_file = f"{output_dir}/{name.lower()}_{timestamp}.jsonl.gz"
+        
+        count = 0
+        with gzip.open(results_file, 'wb') as f:
+            for result in results:
+                f.write(_dumps_line(result))
+                count += 1
+        
+        print(f"✅ Streamed {count} results: {results_file}")
+        return results_file
+    
+    @staticmethod
+    def iter_results_jsonl(results_file: str) -> Iterator[Dict]:
+        """Read search results back from a file written by write_results_jsonl"""
+        with gzip.open(results_file, 'rb') as f:
+            for line in f:
+                yield _loads(line)
+    
+    @staticmethod
+    def extract_individual_features(batch_results: Union[str, Iterable[Dict]]) -> Iterator[Feature]:
+        """Yield individual feature records from batch search results
+        
+        Args:
+            batch_results: Search results, or the path of a JSONL file from write_results_jsonl
+            
+        Yields:
+            Feature records, one at a time, tagged with their search term
+        """
+        if isinstance(batch_results, str):
+            batch_results = BVBRCUtils.iter_results_jsonl(batch_results)
         
-        return all_results
+        for result in batch_results:
+            search_term = result.get('search_term', '')
+            for record in result.get('features', []):
+                yield Feature.from_record(record, search_term)
     
     @staticmethod
     def save_track_results(track_results: Dict, output_dir: str = ".") -> List[str]:
@@ -5,11 +5,16 @@ Systematic search for bacterial amyloid systems using expanded gene names and fu
 """
 
 from shared_utilities import bvbrc_utils
-from typing import List, Dict
+from typing import Dict, Iterable, List, Union
+from collections import defaultdict
+import re
 
 class BacterialAmyloidsTrack:
     """Track 1: Bacterial amyloid systems search and analysis"""
     
+    # Product keywords indicating a secreted/exported amyloid
+    _SECRETION_RE = re.compile(r'signal|secreted|extracellular|exported')
+    
     def __init__(self):
         """Initialize Track 1 with expanded amyloid search terms"""
         self.track_name = "Bacterial_Amyloids"
@@ -76,9 +81,13 @@ class BacterialAmyloidsTrack:
         
         return functional_results
     
-    def analyze_amyloid_results(self, gene_results: List[Dict], functional_results: List[Dict]) -> Dict:
+    def analyze_amyloid_results(self, gene_results: Union[str, Iterable[Dict]],
+                                functional_results: Union[str, Iterable[Dict]]) -> Dict:
         """Analyze combined amyloid search results for biological insights
         
+        Features are consumed in a single streaming pass, so each argument may be
+        a list of results or the path of a JSONL file from write_results_jsonl.
+        
         Args:
             gene_results: Results from gene name searches
             functional_results: Results from functional searches
@@ -88,56 +97,57 @@ class BacterialAmyloidsTrack:
         """
         print(f"\n=== TRACK 1 BIOLOGICAL ANALYSIS ===")
         
-        # Extract individual features
-        gene_features = bvbrc_utils.extract_individual_features(gene_results)
-        functional_features = bvbrc_utils.extract_individual_features(functional_results)
-        
-        analysis = {
-            'gene_features_count': len(gene_features),
-            'functional_features_count': len(functional_features),
-            'total_features': len(gene_features) + len(functional_features)
-        }
-        
-        # Analyze curli system completeness
         curli_genes = ['csgA', 'csgB', 'csgC', 'csgD', 'csgE', 'csgF', 'csgG']
         curli_hits = {}
-        
-        for feature in gene_features:
-            gene = feature['gene'].lower()
+        secreted_count = 0
+        gene_count = 0
+        functional_count = 0
+        # Genome distribution flags (bit 1 = gene hit, bit 2 = functional hit)
+        genome_flags = defaultdict(int)
+        
+        for feature in bvbrc_utils.extract_individual_features(gene_results):
+            gene_count += 1
+            genome_flags[feature.genome_id] |= 1
+            
+            # Curli system completeness
+            gene = feature.gene.lower()
             if gene in curli_genes:
                 if gene not in curli_hits:
                     curli_hits[gene] = []
-                curli_hits[gene].append(feature['genome_id'])
+                curli_hits[gene].append(feature.genome_id)
+            
+            # Secretion potential
+            if self._SECRETION_RE.search(feature.product.lower()):
+                secreted_count += 1
+        
+        for feature in bvbrc_utils.extract_individual_features(functional_results):
+            functional_count += 1
+            genome_flags[feature.genome_id] |= 2
+            
+            if self._SECRETION_RE.search(feature.product.lower()):
+                secreted_count += 1
+        
+        analysis = {
+            'gene_features_count': gene_count,
+            'functional_features_count': functional_count,
+            'total_features': gene_count + functional_count
+        }
         
         analysis['curli_system_analysis'] = {
             'genes_found': list(curli_hits.keys()),
             'complete_operons': self._find_complete_curli_operons(curli_hits)
         }
         
-        # Analyze secretion potential
-        secretion_indicators = ['signal', 'secreted', 'extracellular', 'exported']
-        secreted_amyloids = []
-        
-        for feature in gene_features + functional_features:
-            product = feature['product'].lower()
-            if any(indicator in product for indicator in secretion_indicators):
-                secreted_amyloids.append(feature)
-        
         analysis['secretion_analysis'] = {
-            'secreted_amyloid_count': len(secreted_amyloids),
-            'secretion_percentage': len(secreted_amyloids) / analysis['total_features'] * 100 if analysis['total_features'] > 0 else 0
+            'secreted_amyloid_count': secreted_count,
+            'secretion_percentage': secreted_count / analysis['total_features'] * 100 if analysis['total_features'] > 0 else 0
         }
         
-        # Genome distribution analysis
-        gene_genomes = set(f['genome_id'] for f in gene_features)
-        functional_genomes = set(f['genome_id'] for f in functional_features)
-        all_genomes = gene_genomes.union(functional_genomes)
-        
         analysis['genome_distribution'] = {
-            'genomes_with_gene_hits': len(gene_genomes),
-            'genomes_with_functional_hits': len(functional_genomes),
-            'total_genomes_with_amyloids': len(all_genomes),
-            'overlap_genomes': len(gene_genomes.intersection(functional_genomes))
+            'genomes_with_gene_hits': sum(1 for v in genome_flags.values() if v & 1),
+            'genomes_with_functional_hits': sum(1 for v in genome_flags.values() if v & 2),
+            'total_genomes_with_amyloids': len(genome_flags),
+            'overlap_genomes': sum(1 for v in genome_flags.values() if v == 3)
         }
         
         print(f"📊 Amyloid Analysis Complete:")
@@ -5,75 +5,85 @@ Systematic search for bacterial amyloid systems using expanded gene names and fu
 """
 
 from shared_utilities import bvbrc_utils
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Union
+from collections import defaultdict
+import re
+
+# Expanded gene name searches (24 total)
+_GENE_TERMS = (
+    # Primary Curli System (E. coli)
+    'csgA', 'csgB', 'csgC', 'csgD', 'csgE', 'csgF', 'csgG',
+    
+    # Salmonella Curli Equivalents
+    'agfA', 'agfB', 'agfC', 'agfD',
+    
+    # Bacillus Biofilm Matrix
+    'tasA', 'tapA', 'sipW', 'bslA', 'epsH',
+    
+    # Pseudomonas Functional Amyloids
+    'fapA', 'fapB', 'fapC', 'fapD',
+    
+    # Staphylococcal Systems
+    'psmA', 'psmB', 'psmC', 'psmD',
+    
+    # Streptomyces Systems
+    'chpA', 'chpB', 'chpC', 'chpD', 'chpE', 'chpF', 'chpG', 'chpH',
+    'rodA', 'rodB',
+    
+    # Other Bacterial Amyloids
+    'repA', 'hfq'
+)
+
+# Functional keyword searches (15 total)
+_FUNC_TERMS = (
+    'curli',
+    'biofilm matrix protein',
+    'biofilm structural protein', 
+    'functional amyloid',
+    'aggregation protein',
+    'phenol soluble modulin',
+    'chaplins',
+    'rodlins',
+    'extracellular matrix',
+    'secreted aggregation',
+    'amyloid fiber',
+    'biofilm assembly',
+    'surface protein',
+    'adhesin',
+    'fimbrial protein'
+)
+
+_ALL_TERMS = _GENE_TERMS + _FUNC_TERMS
 
 class BacterialAmyloidsTrack:
     """Track 1: Bacterial amyloid systems search and analysis"""
     
+    # Product keywords indicating a secreted/exported amyloid
+    _SECRETION_RE = re.compile(r'signal|secreted|extracellular|exported')
+    
     def __init__(self):
         """Initialize Track 1 with expanded amyloid search terms"""
         self.track_name = "Bacterial_Amyloids"
         
-        # Expanded gene name searches (24 total)
-        self.gene_search_terms = [
-            # Primary Curli System (E. coli)
-            'csgA', 'csgB', 'csgC', 'csgD', 'csgE', 'csgF', 'csgG',
-            
-            # Salmonella Curli Equivalents
-            'agfA', 'agfB', 'agfC', 'agfD',
-            
-            # Bacillus Biofilm Matrix
-            'tasA', 'tapA', 'sipW', 'bslA', 'epsH',
-            
-            # Pseudomonas Functional Amyloids
-            'fapA', 'fapB', 'fapC', 'fapD',
-            
-            # Staphylococcal Systems
-            'psmA', 'psmB', 'psmC', 'psmD',
-            
-            # Streptomyces Systems
-            'chpA', 'chpB', 'chpC', 'chpD', 'chpE', 'chpF', 'chpG', 'chpH',
-            'rodA', 'rodB',
-            
-            # Other Bacterial Amyloids
-            'repA', 'hfq'
-        ]
-        
-        # Functional keyword searches (15 total)
-        self.functional_search_terms = [
-            'curli',
-            'biofilm matrix protein',
-            'biofilm structural protein', 
-            'functional amyloid',
-            'aggregation protein',
-            'phenol soluble modulin',
-            'chaplins',
-            'rodlins',
-            'extracellular matrix',
-            'secreted aggregation',
-            'amyloid fiber',
-            'biofilm assembly',
-            'surface protein',
-            'adhesin',
-            'fimbrial protein'
-        ]
-        
-        self.all_search_terms = self.gene_search_terms + self.functional_search_terms
+        # Search terms are shared module-level tuples, so construction allocates nothing new
+        self.gene_search_terms = _GENE_TERMS
+        self.functional_search_terms = _FUNC_TERMS
+        self.all_search_terms = _ALL_TERMS
         
         print(f"🧬 Track 1 initialized: {len(self.gene_search_terms)} gene terms + {len(self.functional_search_terms)} functional terms")
     
-    def run_gene_searches(self, genome_ids: List[str]) -> List[Dict]:
+    def run_gene_searches(self, genome_ids: List[str]) -> Iterator[Dict]:
         """Execute gene name searches across all representative genomes
         
         Args:
             genome_ids: List of genome IDs to search
             
         Returns:
-            List of batch search results for gene searches
+            Iterator of batch search results for gene searches, one per term as it completes
         """
         print(f"\n=== TRACK 1A: GENE NAME SEARCHES ===")
         
-        gene_results = bvbrc_utils.batch_search_across_genomes(
+        gene_results = bvbrc_utils.iter_search_across_genomes(
             search_terms=self.gene_search_terms,
             genome_ids=genome_ids,
             search_type='gene',
@@ -82,18 +92,18 @@ class BacterialAmyloidsTrack:
         
         return gene_results
     
-    def run_functional_searches(self, genome_ids: List[str]) -> List[Dict]:
+    def run_functional_searches(self, genome_ids: List[str]) -> Iterator[Dict]:
         """Execute functional keyword searches across all representative genomes
         
         Args:
             genome_ids: List of genome IDs to search
             
         Returns:
-            List of batch search results for functional searches
+            Iterator of batch search results for functional searches, one per term as it completes
         """
         print(f"\n=== TRACK 1B: FUNCTIONAL KEYWORD SEARCHES ===")
         
-        functional_results = bvbrc_utils.batch_search_across_genomes(
+        functional_results = bvbrc_utils.iter_search_across_genomes(
             search_terms=self.functional_search_terms,
             genome_ids=genome_ids,
             search_type='keyword',
@@ -102,9 +112,13 @@ class BacterialAmyloidsTrack:
         
         return functional_results
     
-    def analyze_amyloid_results(self, gene_results: List[Dict], functional_results: List[Dict]) -> Dict:
+    def analyze_amyloid_results(self, gene_results: Union[str, Iterable[Dict]],
+                                functional_results: Union[str, Iterable[Dict]]) -> Dict:
         """Analyze combined amyloid search results for biological insights
         
+        Features are consumed in a single streaming pass, so each argument may be
+        a list of results or the path of a JSONL file from write_results_jsonl.
+        
         Args:
             gene_results: Results from gene name searches
             functional_results: Results from functional searches
@@ -114,56 +128,57 @@ class BacterialAmyloidsTrack:
         """
         print(f"\n=== TRACK 1 BIOLOGICAL ANALYSIS ===")
         
-        # Extract individual features
-        gene_features = bvbrc_utils.extract_individual_features(gene_results)
-        functional_features = bvbrc_utils.extract_individual_features(functional_results)
-        
-        analysis = {
-            'gene_features_count': len(gene_features),
-            'functional_features_count': len(functional_features),
-            'total_features': len(gene_features) + len(functional_features)
-        }
-        
-        # Analyze curli system completeness
         curli_genes = ['csgA', 'csgB', 'csgC', 'csgD', 'csgE', 'csgF', 'csgG']
         curli_hits = {}
-        
-        for feature in gene_features:
-            gene = feature['gene'].lower()
+        secreted_count = 0
+        gene_count = 0
+        functional_count = 0
+        # Genome distribution flags (bit 1 = gene hit, bit 2 = functional hit)
+        genome_flags = defaultdict(int)
+        
+        for feature in bvbrc_utils.extract_individual_features(gene_results):
+            gene_count += 1
+            genome_flags[feature.genome_id] |= 1
+            
+            # Curli system completeness
+            gene = feature.gene.lower()
             if gene in curli_genes:
                 if gene not in curli_hits:
                     curli_hits[gene] = []
-                curli_hits[gene].append(feature['genome_id'])
+                curli_hits[gene].append(feature.genome_id)
+            
+            # Secretion potential
+            if self._SECRETION_RE.search(feature.product.lower()):
+                secreted_count += 1
+        
+        for feature in bvbrc_utils.extract_individual_features(functional_results):
+            functional_count += 1
+            genome_flags[feature.genome_id] |= 2
+            
+            if self._SECRETION_RE.search(feature.product.lower()):
+                secreted_count += 1
+        
+        analysis = {
+            'gene_features_count': gene_count,
+            'functional_features_count': functional_count,
+            'total_features': gene_count + functional_count
+        }
         
         analysis['curli_system_analysis'] = {
             'genes_found': list(curli_hits.keys()),
             'complete_operons': self._find_complete_curli_operons(curli_hits)
         }
         
-        # Analyze secretion potential
-        secretion_indicators = ['signal', 'secreted', 'extracellular', 'exported']
-        secreted_amyloids = []
-        
-        for feature in gene_features + functional_features:
-            product = feature['product'].lower()
-            if any(indicator in product for indicator in secretion_indicators):
-                secreted_amyloids.append(feature)
-        
         analysis['secretion_analysis'] = {
-            'secreted_amyloid_count': len(secreted_amyloids),
-            'secretion_percentage': len(secreted_amyloids) / analysis['total_features'] * 100 if analysis['total_features'] > 0 else 0
+            'secreted_amyloid_count': secreted_count,
+            'secretion_percentage': secreted_count / analysis['total_features'] * 100 if analysis['total_features'] > 0 else 0
         }
         
-        # Genome distribution analysis
-        gene_genomes = set(f['genome_id'] for f in gene_features)
-        functional_genomes = set(f['genome_id'] for f in functional_features)
-        all_genomes = gene_genomes.union(functional_genomes)
-        
         analysis['genome_distribution'] = {
-            'genomes_with_gene_hits': len(gene_genomes),
-            'genomes_with_functional_hits': len(functional_genomes),
-            'total_genomes_with_amyloids': len(all_genomes),
-            'overlap_genomes': len(gene_genomes.intersection(functional_genomes))
+            'genomes_with_gene_hits': sum(1 for v in genome_flags.values() if v & 1),
+            'genomes_with_functional_hits': sum(1 for v in genome_flags.values() if v & 2),
+            'total_genomes_with_amyloids': len(genome_flags),
+            'overlap_genomes': sum(1 for v in genome_flags.values() if v == 3)
         }
         
         print(f"📊 Amyloid Analysis Complete:")
@@ -223,25 +238,16 @@ class BacterialAmyloidsTrack:
         
         print(f"🎯 Processing {len(genome_ids)} genomes with {len(self.all_search_terms)} search terms")
         
-        # Execute searches
-        gene_results = self.run_gene_searches(genome_ids)
-        functional_results = self.run_functional_searches(genome_ids)
-        
-        # Combine and save results
-        all_results = gene_results + functional_results
-        
-        # Save track results
-        batch_file, features_file = bvbrc_utils.save_track_results(
-            batch_results=all_results,
-            track_name=self.track_name,
-            search_terms=self.all_search_terms
+        # Execute searches, streaming each term's results to disk as it completes
+        gene_file = bvbrc_utils.write_results_jsonl(
+            self.run_gene_searches(genome_ids), f"{self.track_name}_gene_results"
+        )
+        functional_file = bvbrc_utils.write_results_jsonl(
+            self.run_functional_searches(genome_ids), f"{self.track_name}_functional_results"
         )
         
-        # Create visualizations
-        bvbrc_utils.create_track_visualization(all_results, self.track_name)
-        
-        # Perform biological analysis
-        analysis = self.analyze_amyloid_results(gene_results, functional_results)
+        # Perform biological analysis in one pass over the saved results
+        analysis = self.analyze_amyloid_results(gene_file, functional_file)
         
         # Compile final results
         track_results = {
@@ -250,12 +256,10 @@ class BacterialAmyloidsTrack:
             'functional_search_terms': self.functional_search_terms,
             'total_search_terms': len(self.all_search_terms),
             'genomes_processed': len(genome_ids),
-            'gene_results': gene_results,
-            'functional_results': functional_results,
             'biological_analysis': analysis,
             'output_files': {
-                'batch_results': batch_file,
-                'features_csv': features_file
+                'gene_results': gene_file,
+                'functional_results': functional_file
             }
         }
         
@@ -4,62 +4,88 @@ Track 3: SOD (Superoxide Dismutase) Systems
 Systematic search for bacterial antioxidant defense systems, particularly SOD and catalase
 """
 
-from shared_utilities import bvbrc_utils
-from typing import List, Dict
+from shared_utilities import bvbrc_utils, Feature
+from typing import Dict, Iterable, List
+import re
+import numpy as np
+import pandas as pd
+
+# SOD and antioxidant enzyme genes (28 total)
+_GENE_TERMS = (
+    # Superoxide Dismutases
+    'sodA', 'sodB', 'sodC', 'sodM', 'sodF',          # Main SOD enzymes
+    'sod1', 'sod2', 'sod3',                          # Alternative naming
+    
+    # Catalases
+    'katA', 'katB', 'katC', 'katE', 'katG', 'katN',  # Catalase variants
+    'hpxO', 'hpxQ',                                  # Manganese catalases
+    
+    # Peroxidases and Related
+    'ahpC', 'ahpF',                                  # Alkyl hydroperoxide reductase
+    'tpx', 'bcp',                                    # Thiol peroxidases
+    'ohr', 'osmC',                                   # Organic hydroperoxide resistance
+    'dps',                                           # DNA protection during starvation
+    
+    # Glutathione System
+    'gor', 'grx', 'gshA', 'gshB',                    # Glutathione metabolism
+    'trxA', 'trxB', 'trxC'                           # Thioredoxin system
+)
+
+# Functional keyword searches (20 total)
+_FUNC_TERMS = (
+    'superoxide dismutase',
+    'catalase',
+    'peroxidase',
+    'antioxidant',
+    'oxidative stress',
+    'superoxide radical',
+    'hydrogen peroxide',
+    'reactive oxygen',
+    'ROS detoxification',
+    'alkyl hydroperoxide reductase',
+    'thiol peroxidase',
+    'manganese superoxide dismutase',
+    'iron superoxide dismutase',  
+    'copper zinc superoxide dismutase',
+    'catalase peroxidase',
+    'glutathione peroxidase',
+    'thioredoxin',
+    'glutaredoxin',
+    'DNA protection protein',
+    'oxidative damage'
+)
+
+_ALL_TERMS = _GENE_TERMS + _FUNC_TERMS
 
 class SODSystemsTrack:
     """Track 3: SOD and antioxidant systems search and analysis"""
     
+    # First-match dispatch table: (field, pattern, system) in priority order.
+    # Gene names are checked before product descriptions; anything left over
+    # falls through to 'other_antioxidants'.
+    _CLASSIFIERS = (
+        ('gene', re.compile(r'soda|sodb|sodc|sodm|sodf|sod1|sod2|sod3'), 'superoxide_dismutases'),
+        ('gene', re.compile(r'kata|katb|katc|kate|katg|katn|hpxo|hpxq'), 'catalases'),
+        ('gene', re.compile(r'ahpc|ahpf|tpx|bcp|ohr'), 'peroxidases'),
+        ('gene', re.compile(r'gor|grx|gsha|gshb'), 'glutathione_system'),
+        ('gene', re.compile(r'trxa|trxb|trxc'), 'thioredoxin_system'),
+        ('gene', re.compile(r'dps|osmc'), 'dna_protection'),
+        ('product', re.compile(r'superoxide dismutase'), 'superoxide_dismutases'),
+        ('product', re.compile(r'catalase'), 'catalases'),
+        ('product', re.compile(r'peroxidase|hydroperoxide'), 'peroxidases'),
+        ('product', re.compile(r'glutathione|glutaredoxin'), 'glutathione_system'),
+        ('product', re.compile(r'thioredoxin'), 'thioredoxin_system'),
+        ('product', re.compile(r'dna protection|starvation'), 'dna_protection')
+    )
+    
     def __init__(self):
         """Initialize Track 3 with comprehensive SOD and antioxidant search terms"""
         self.track_name = "SOD_Systems"
         
-        # SOD and antioxidant enzyme genes (28 total)
-        self.gene_search_terms = [
-            # Superoxide Dismutases
-            'sodA', 'sodB', 'sodC', 'sodM', 'sodF',          # Main SOD enzymes
-            'sod1', 'sod2', 'sod3',                          # Alternative naming
-            
-            # Catalases
-            'katA', 'katB', 'katC', 'katE', 'katG', 'katN',  # Catalase variants
-            'hpxO', 'hpxQ',                                  # Manganese catalases
-            
-            # Peroxidases and Related
-            'ahpC', 'ahpF',                                  # Alkyl hydroperoxide reductase
-            'tpx', 'bcp',                                    # Thiol peroxidases
-            'ohr', 'osmC',                                   # Organic hydroperoxide resistance
-            'dps',                                           # DNA protection during starvation
-            
-            # Glutathione System
-            'gor', 'grx', 'gshA', 'gshB',                    # Glutathione metabolism
-            'trxA', 'trxB', 'trxC'                           # Thioredoxin system
-        ]
-        
-        # Functional keyword searches (20 total)
-        self.functional_search_terms = [
-            'superoxide dismutase',
-            'catalase',
-            'peroxidase',
-            'antioxidant',
-            'oxidative stress',
-            'superoxide radical',
-            'hydrogen peroxide',
-            'reactive oxygen',
-            'ROS detoxification',
-            'alkyl hydroperoxide reductase',
-            'thiol peroxidase',
-            'manganese superoxide dismutase',
-            'iron superoxide dismutase',  
-            'copper zinc superoxide dismutase',
-            'catalase peroxidase',
-            'glutathione peroxidase',
-            'thioredoxin',
-            'glutaredoxin',
-            'DNA protection protein',
-            'oxidative damage'
-        ]
-        
-        self.all_search_terms = self.gene_search_terms + self.functional_search_terms
+        # Search terms are shared module-level tuples, so construction allocates nothing new
+        self.gene_search_terms = _GENE_TERMS
+        self.functional_search_terms = _FUNC_TERMS
+        self.all_search_terms = _ALL_TERMS
         
         print(f"🔵 Track 3 initialized: {len(self.gene_search_terms)} gene terms + {len(self.functional_search_terms)} functional terms")
     
@@ -155,15 +181,18 @@ class SODSystemsTrack:
         
         return track_summary
     
-    def get_sod_system_classification(self, features: List[Dict]) -> Dict:
+    def get_sod_system_classification(self, features: Iterable[Feature]) -> Dict:
         """Classify SOD/antioxidant systems found in features
         
         Args:
-            features: List of feature dictionaries
+            features: Feature records, e.g. straight from bvbrc_utils.extract_individual_features
             
         Returns:
             Classification summary of antioxidant systems
         """
+        # Materialize once: rows are indexed by position below
+        features = list(features)
+        
         systems = {
             'superoxide_dismutases': [],    # sodA, sodB, sodC
             'catalases': [],               # katA, katB, katE, etc.
@@ -174,76 +203,55 @@ class SODSystemsTrack:
             'other_antioxidants': []      # ohr, etc.
         }
         
-        for feature in features:
-            gene = feature.get('gene', '').lower()
-            product = feature.get('product', '').lower()
-            
-            # Classify by gene name patterns
-            if any(term in gene for term in ['soda', 'sodb', 'sodc', 'sodm', 'sodf', 'sod1', 'sod2', 'sod3']):
-                systems['superoxide_dismutases'].append(feature)
-                # Add metal cofactor info if available
-                if 'manganese' in product or 'mn' in product or 'soda' in gene:
-                    feature['metal_cofactor'] = 'Manganese'
-                elif 'iron' in product or 'fe' in product or 'sodb' in gene:
-                    feature['metal_cofactor'] = 'Iron'
-                elif 'copper' in product or 'zinc' in product or 'cu' in product or 'zn' in product or 'sodc' in gene:
-                    feature['metal_cofactor'] = 'Copper-Zinc'
-                else:
-                    feature['metal_cofactor'] = 'Unknown'
-                    
-            elif any(term in gene for term in ['kata', 'katb', 'katc', 'kate', 'katg', 'katn', 'hpxo', 'hpxq']):
-                systems['catalases'].append(feature)
-                
-            elif any(term in gene for term in ['ahpc', 'ahpf', 'tpx', 'bcp', 'ohr']):
-                systems['peroxidases'].append(feature)
-                
-            elif any(term in gene for term in ['gor', 'grx', 'gsha', 'gshb']):
-                systems['glutathione_system'].append(feature)
-                
-            elif any(term in gene for term in ['trxa', 'trxb', 'trxc']):
-                systems['thioredoxin_system'].append(feature)
-                
-            elif any(term in gene for term in ['dps', 'osmc']):
-                systems['dna_protection'].append(feature)
-                
-            # Classify by product description  
-            elif 'superoxide dismutase' in product:
-                systems['superoxide_dismutases'].append(feature)
-                # Infer metal cofactor from product description
-                if 'manganese' in product or 'mn' in product:
-                    feature['metal_cofactor'] = 'Manganese'
-                elif 'iron' in product or 'fe' in product:
-                    feature['metal_cofactor'] = 'Iron'  
-                elif 'copper' in product or 'zinc' in product:
-                    feature['metal_cofactor'] = 'Copper-Zinc'
-                else:
-                    feature['metal_cofactor'] = 'Inferred from gene'
-                    
-            elif 'catalase' in product:
-                systems['catalases'].append(feature)
-                
-            elif any(term in product for term in ['peroxidase', 'hydroperoxide']):
-                systems['peroxidases'].append(feature)
-                
-            elif any(term in product for term in ['glutathione', 'glutaredoxin']):
-                systems['glutathione_system'].append(feature)
-                
-            elif 'thioredoxin' in product:
-                systems['thioredoxin_system'].append(feature)
-                
-            elif any(term in product for term in ['dna protection', 'starvation']):
-                systems['dna_protection'].append(feature)
-                
-            else:
-                systems['other_antioxidants'].append(feature)
+        if not features:
+            return systems
+        
+        # Lower-cased gene/product columns (Feature already normalizes missing values to '')
+        columns = {
+            'gene': pd.Series([feature.gene for feature in features], dtype=str).str.lower(),
+            'product': pd.Series([feature.product for feature in features], dtype=str).str.lower()
+        }
+        
+        # First matching classifier wins; each one only scans rows not yet classified
+        category = pd.Series('', index=columns['gene'].index)
+        by_gene = pd.Series(False, index=columns['gene'].index)
+        for field, regex, system in self._CLASSIFIERS:
+            pending = category == ''
+            if not pending.any():
+                break
+            hits = pending.copy()
+            hits[pending] = columns[field][pending].str.contains(regex)
+            category[hits] = system
+            if field == 'gene':
+                by_gene |= hits
+        category[category == ''] = 'other_antioxidants'
+        
+        for system, rows in category.groupby(category, sort=False).groups.items():
+            systems[system] = [features[i] for i in rows]
+        
+        # Add metal cofactor info to SOD features in one vectorized pass. Gene-matched
+        # SODs may also use gene names and cu/zn abbreviations; first condition wins.
+        sod = category == 'superoxide_dismutases'
+        sod_gene, sod_product, sod_by_gene = columns['gene'][sod], columns['product'][sod], by_gene[sod]
+        manganese = sod_product.str.contains('manganese|mn') | (sod_by_gene & sod_gene.str.contains('soda'))
+        iron = sod_product.str.contains('iron|fe') | (sod_by_gene & sod_gene.str.contains('sodb'))
+        copper_zinc = sod_product.str.contains('copper|zinc') | (
+            sod_by_gene & (sod_product.str.contains('cu|zn') | sod_gene.str.contains('sodc')))
+        cofactors = np.select(
+            [manganese, iron, copper_zinc, sod_by_gene],
+            ['Manganese', 'Iron', 'Copper-Zinc', 'Unknown'],
+            default='Inferred from gene'
+        )
+        for i, cofactor in zip(sod_gene.index, cofactors.tolist()):
+            features[i].metal_cofactor = cofactor
         
         return systems
     
-    def analyze_metal_cofactor_distribution(self, sod_features: List[Dict]) -> Dict:
+    def analyze_metal_cofactor_distribution(self, sod_features: List[Feature]) -> Dict:
         """Analyze distribution of SOD metal cofactors
         
         Args:
-            sod_features: List of SOD feature dictionaries
+            sod_features: List of SOD Feature records
             
         Returns:
             Metal cofactor distribution summary
@@ -256,7 +264,7 @@ class SODSystemsTrack:
         }
         
         for feature in sod_features:
-            cofactor = feature.get('metal_cofactor', 'Unknown')
+            cofactor = feature.metal_cofactor or 'Unknown'
             cofactor_counts[cofactor] += 1
         
         return {